@@ -0,0 +1,25 @@
+"""Batch coordinate conversion helpers for bulk redaction import."""
+
+from collections.abc import Iterable
+
+Box = tuple[float, float, float, float]
+
+
+def view_to_pdf_batch(rects: Iterable[Box], inv_zoom: float) -> list[Box]:
+    """
+    Convert view-space rectangles to PDF-space rectangles.
+
+    Works on plain (x0, y0, x1, y1) tuples so bulk imports (e.g. OCR bounding
+    boxes) do not need to build a QRectF per box.
+
+    Args:
+        rects: Rectangles in viewer scene coordinates (pixels)
+        inv_zoom: Inverse of the zoom factor the page was rendered at
+
+    Returns:
+        Rectangles in PDF coordinates (points)
+    """
+    return [
+        (x0 * inv_zoom, y0 * inv_zoom, x1 * inv_zoom, y1 * inv_zoom)
+        for x0, y0, x1, y1 in rects
+    ]
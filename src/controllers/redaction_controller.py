@@ -1,26 +1,71 @@
 """Controller for managing PDF redaction operations."""
 
-from PyQt6.QtCore import QRectF
+from collections.abc import Callable
+
+from PyQt6.QtCore import QObject, QRectF, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QImage
 import fitz
 
 from models.pdf_document import PDFDocument
+from controllers.render_task import RenderSignals, RenderTask
+from controllers._coord_kernels import Box, view_to_pdf_batch
 
 
-class RedactionController:
+class RedactionController(QObject):
     """
     Coordinates between PDF model and viewer.
 
     Handles business logic for loading PDFs, converting coordinates,
     and managing redaction state.
+
+    Signals:
+        page_rendered: Emitted when a page requested with request_page() is ready
+                       Parameters: (QImage image, tuple page_size)
+        zoom_rendered: Emitted when the current page, re-rendered at a new zoom
+                       with request_zoom(), is ready
+                       Parameters: (QImage image, tuple page_size,
+                       float old_zoom, float new_zoom)
+        tile_rendered: Emitted when a visible region requested with
+                       request_visible_tile() is ready
+                       Parameters: (QImage image, tuple clip, float zoom), where
+                       clip is (x0, y0, x1, y1) in PDF coordinates
     """
 
+    page_rendered = pyqtSignal(QImage, tuple)  # image, page_size
+    zoom_rendered = pyqtSignal(QImage, tuple, float, float)  # image, page_size, old_zoom, new_zoom
+    tile_rendered = pyqtSignal(QImage, tuple, float)  # image, clip, zoom
+
+    # Zoom a newly opened document is rendered at
+    DEFAULT_ZOOM = 1.5
+
+    # Range of zoom factors pages are rasterized at; beyond it the viewer
+    # scales the image instead
+    MIN_RENDER_ZOOM = 0.25
+    MAX_RENDER_ZOOM = 4.0
+    # Relative zoom change below which a page is not re-rendered
+    ZOOM_TOLERANCE = 0.01
+    # Upper bound for zooms of visible-region tiles
+    MAX_TILE_ZOOM = 16.0
+
     def __init__(self):
         """Initialize the controller."""
+        super().__init__()
         self.pdf_model = PDFDocument()
-        self.current_zoom = 1.5
+        self.current_zoom = self.DEFAULT_ZOOM
+        self._inv_zoom = 1.0 / self.current_zoom
         self.current_page_num = 0
 
+        # Background rendering; only the result of the latest request is kept
+        self._render_signals = RenderSignals()
+        self._render_signals.finished.connect(self._on_render_finished)
+        self._render_request_id = 0
+        self._pending_page_num: int | None = None
+        self._tile_request_id = 0
+
+        # Returns the visible page region (x0, y0, x1, y1) in PDF coordinates
+        # for the given render zoom, or None if nothing is shown
+        self._visible_rect_provider: Callable[[float], tuple | None] | None = None
+
     def open_pdf(self, file_path: str) -> tuple[bool, str]:
         """
         Open a PDF file.
@@ -33,8 +78,15 @@ class RedactionController:
         """
         success = self.pdf_model.open_pdf(file_path)
 
+        # Results of renders started for the previous document are stale
+        self._render_request_id += 1
+        self._tile_request_id += 1
+        self._pending_page_num = None
+
         if success:
             self.current_page_num = 0
+            # Zoom reached in the previous document does not carry over
+            self.set_zoom(self.DEFAULT_ZOOM)
             return True, "PDF opened successfully"
         else:
             return False, "Failed to open PDF file"
@@ -48,6 +100,19 @@ class RedactionController:
         """
         return self.pdf_model.render_page(self.current_page_num, self.current_zoom)
 
+    def get_current_page_redactions(self) -> list[QRectF]:
+        """
+        Get the stored redactions of the current page in viewer coordinates.
+
+        Returns:
+            Rectangles in scene coordinates (pixels of the rendered image)
+        """
+        zoom = self.current_zoom
+        return [
+            QRectF(x0 * zoom, y0 * zoom, (x1 - x0) * zoom, (y1 - y0) * zoom)
+            for x0, y0, x1, y1 in self.pdf_model.get_redaction_rects(self.current_page_num)
+        ]
+
     def add_redaction(self, view_rect: QRectF, page_size: tuple[float, float]) -> None:
         """
         Add a redaction rectangle.
@@ -64,6 +129,21 @@ class RedactionController:
         # Add to PDF model
         self.pdf_model.add_redaction_rect(self.current_page_num, pdf_rect)
 
+    def add_redaction_boxes(self, view_boxes: list[Box]) -> None:
+        """
+        Add redactions to the current page from raw (x0, y0, x1, y1) boxes.
+
+        This is the single bulk-import entry point (e.g. for OCR bounding
+        boxes). Nothing in the app calls it yet; it is kept public for a
+        future importer.
+
+        Args:
+            view_boxes: Boxes in viewer scene coordinates (pixels)
+        """
+        self.pdf_model.add_redaction_boxes(
+            self.current_page_num, view_to_pdf_batch(view_boxes, self._inv_zoom)
+        )
+
     def convert_view_to_pdf_coords(
         self, view_rect: QRectF, page_size: tuple[float, float]
     ) -> fitz.Rect:
@@ -85,27 +165,29 @@ class RedactionController:
 
         # The rendered image has dimensions: page_size * zoom
         # So to convert back: pdf_coord = view_coord / zoom
-        x0 = view_rect.left() / self.current_zoom
-        y0 = view_rect.top() / self.current_zoom
-        x1 = view_rect.right() / self.current_zoom
-        y1 = view_rect.bottom() / self.current_zoom
+        inv_zoom = self._inv_zoom
+        x0 = view_rect.left() * inv_zoom
+        y0 = view_rect.top() * inv_zoom
+        x1 = view_rect.right() * inv_zoom
+        y1 = view_rect.bottom() * inv_zoom
 
         # Create PDF rectangle
         # Note: PDF coordinates have origin at bottom-left, but for redactions
         # PyMuPDF handles this correctly with the rect as-is
         return fitz.Rect(x0, y0, x1, y1)
 
-    def save_redacted_pdf(self, output_path: str) -> bool:
+    def save_redacted_pdf(self, output_path: str, full_rewrite: bool = False) -> bool:
         """
         Save the PDF with redactions applied.
 
         Args:
             output_path: Path where to save the redacted PDF
+            full_rewrite: Also deduplicate and compact objects; slower
 
         Returns:
             True if successful, False otherwise
         """
-        return self.pdf_model.save_redacted_pdf(output_path)
+        return self.pdf_model.save_redacted_pdf(output_path, full_rewrite)
 
     def is_pdf_open(self) -> bool:
         """Check if a PDF is currently open."""
@@ -119,6 +201,7 @@ class RedactionController:
             zoom: Zoom factor (1.0 = 100%, 2.0 = 200%, etc.)
         """
         self.current_zoom = zoom
+        self._inv_zoom = 1.0 / zoom
 
     def get_page_count(self) -> int:
         """Get the total number of pages in the PDF."""
@@ -168,6 +251,169 @@ class RedactionController:
             return self.get_current_page_image()
         return None, (0.0, 0.0)
 
+    def request_page(self, page_num: int) -> bool:
+        """
+        Render a page in the background and navigate to it once it is ready.
+
+        Returns immediately; page_rendered is emitted when the image is
+        available and current_page_num is updated at that point, so redactions
+        keep going to the page that is actually displayed. A newer request
+        supersedes any render still in flight. The render holds the GIL (see
+        RenderTask), so Python event handling still pauses while it runs.
+
+        Args:
+            page_num: Page number to navigate to (0-indexed)
+
+        Returns:
+            True if the render was scheduled, False if the page does not exist
+        """
+        if not 0 <= page_num < self.get_page_count():
+            return False
+
+        self._render_request_id += 1
+        self._pending_page_num = page_num
+        task = RenderTask(
+            self.pdf_model, self._render_signals, self._render_request_id, page_num, self.current_zoom
+        )
+        QThreadPool.globalInstance().start(task)
+        return True
+
+    def request_zoom(self, zoom: float) -> bool:
+        """
+        Re-render the current page at a new zoom in the background.
+
+        Returns immediately; zoom_rendered is emitted when the image is
+        available and current_zoom is updated at that point, so coordinate
+        conversion matches the image that is actually displayed.
+
+        Args:
+            zoom: Zoom factor (1.0 = 100%, 2.0 = 200%, etc.)
+
+        Returns:
+            True if the render was scheduled, False if no PDF is open or the
+            zoom (clamped to the render range) is within ZOOM_TOLERANCE of
+            the current one
+        """
+        zoom = min(max(zoom, self.MIN_RENDER_ZOOM), self.MAX_RENDER_ZOOM)
+        if not self.is_pdf_open():
+            return False
+        if abs(zoom - self.current_zoom) <= self.ZOOM_TOLERANCE * self.current_zoom:
+            return False
+
+        self._render_request_id += 1
+        self._pending_page_num = self.current_page_num
+        task = RenderTask(
+            self.pdf_model, self._render_signals, self._render_request_id, self.current_page_num, zoom
+        )
+        QThreadPool.globalInstance().start(task)
+        return True
+
+    def set_visible_rect_provider(self, provider: Callable[[float], tuple | None]) -> None:
+        """
+        Set the callback used to find which part of the page is on screen.
+
+        Args:
+            provider: Called with the current render zoom; returns the visible
+                      region (x0, y0, x1, y1) in PDF coordinates, or None
+        """
+        self._visible_rect_provider = provider
+
+    def request_visible_tile(self, zoom: float) -> bool:
+        """
+        Render only the visible region of the current page in the background.
+
+        Used beyond MAX_RENDER_ZOOM, where rasterizing the whole page would be
+        wasteful. tile_rendered is emitted when the tile is ready; a newer tile
+        request supersedes any still in flight.
+
+        Args:
+            zoom: Zoom factor for the tile, clamped to MAX_TILE_ZOOM
+
+        Returns:
+            True if the render was scheduled, False otherwise
+        """
+        if not self.is_pdf_open() or self._visible_rect_provider is None:
+            return False
+
+        visible = self._visible_rect_provider(self.current_zoom)
+        if visible is None:
+            return False
+
+        self._tile_request_id += 1
+        task = RenderTask(
+            self.pdf_model,
+            self._render_signals,
+            self._tile_request_id,
+            self.current_page_num,
+            min(zoom, self.MAX_TILE_ZOOM),
+            fitz.Rect(*visible),
+        )
+        QThreadPool.globalInstance().start(task)
+        return True
+
+    def prefetch_next_page(self) -> None:
+        """
+        Render the page after the current one into the render cache.
+
+        A later request_page() for it is then served from the cache. The
+        render still holds the GIL (see RenderTask), so callers should only
+        prefetch once the user has been idle for a while.
+        """
+        page_num = self.current_page_num + 1
+        if page_num < self.get_page_count() and not self.is_render_pending():
+            task = RenderTask(self.pdf_model, None, 0, page_num, self.current_zoom)
+            QThreadPool.globalInstance().start(task)
+
+    def is_render_pending(self) -> bool:
+        """Check if a page requested with request_page() has not been delivered yet."""
+        return self._pending_page_num is not None
+
+    def _on_render_finished(
+        self,
+        request_id: int,
+        page_num: int,
+        zoom: float,
+        qimage: QImage | None,
+        page_size: tuple,
+        clip: fitz.Rect | None,
+    ) -> None:
+        """
+        Handle a finished background render.
+
+        Args:
+            request_id: Identifier of the request that produced the result
+            page_num: Rendered page number (0-indexed)
+            zoom: Zoom factor used for rendering
+            qimage: Rendered image, or None if rendering failed
+            page_size: Original PDF page size (width, height) in points
+            clip: Rendered region for tiles, or None for whole pages
+        """
+        if clip is not None:
+            # Tiles are only useful for the page and zoom still on screen
+            if (
+                request_id == self._tile_request_id
+                and qimage is not None
+                and page_num == self.current_page_num
+                and not self.is_render_pending()
+            ):
+                self.tile_rendered.emit(qimage, tuple(clip), zoom)
+            return
+
+        if request_id != self._render_request_id:
+            return  # Superseded by a newer request
+
+        self._pending_page_num = None
+        if qimage is None:
+            return
+
+        if page_num == self.current_page_num and zoom != self.current_zoom:
+            old_zoom = self.current_zoom
+            self.set_zoom(zoom)
+            self.zoom_rendered.emit(qimage, page_size, old_zoom, zoom)
+        else:
+            self.current_page_num = page_num
+            self.page_rendered.emit(qimage, page_size)
+
     def has_next_page(self) -> bool:
         """Check if there is a next page."""
         return self.current_page_num < self.get_page_count() - 1
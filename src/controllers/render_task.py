@@ -0,0 +1,74 @@
+"""Background rendering of PDF pages on the Qt thread pool."""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+import fitz
+
+from models.pdf_document import PDFDocument
+
+
+class RenderSignals(QObject):
+    """
+    Signals emitted by a RenderTask.
+
+    QRunnable is not a QObject, so tasks emit through a shared instance that
+    lives in the GUI thread. Emitting from a worker thread then delivers the
+    result through a queued connection.
+
+    Signals:
+        finished: Emitted when the page has been rendered
+                  Parameters: (int request_id, int page_num, float zoom,
+                  QImage | None image, tuple page_size, fitz.Rect | None clip)
+    """
+
+    finished = pyqtSignal(int, int, float, object, tuple, object)
+
+
+class RenderTask(QRunnable):
+    """
+    Renders a single PDF page on a thread pool thread.
+
+    The rendered page is stored in the document's render cache; tasks created
+    without signals are prefetches that only warm that cache.
+
+    Note that PyMuPDF holds the GIL while rasterizing, so this does not make
+    the UI responsive during a render: Qt's own painting continues, but every
+    Python slot and event handler waits until the render finishes. What it
+    buys is that navigation requests return immediately and superseded
+    results are dropped instead of being displayed one after another.
+    """
+
+    def __init__(
+        self,
+        pdf_model: PDFDocument,
+        signals: RenderSignals | None,
+        request_id: int,
+        page_num: int,
+        zoom: float,
+        clip: fitz.Rect | None = None,
+    ):
+        """
+        Initialize the task.
+
+        Args:
+            pdf_model: Document to render from
+            signals: Emitter used to deliver the result, or None to only fill the cache
+            request_id: Identifier used by the requester to discard stale results
+            page_num: Page number to render (0-indexed)
+            zoom: Zoom factor for rendering
+            clip: Region of the page to render in PDF coordinates, or None for all of it
+        """
+        super().__init__()
+        self.pdf_model = pdf_model
+        self.request_id = request_id
+        self.page_num = page_num
+        self.zoom = zoom
+        self.clip = clip
+        self.signals = signals
+
+    def run(self) -> None:
+        """Render the page and emit the result."""
+        qimage, page_size = self.pdf_model.render_page(self.page_num, self.zoom, self.clip)
+        if self.signals is not None:
+            self.signals.finished.emit(
+                self.request_id, self.page_num, self.zoom, qimage, page_size, self.clip
+            )
@@ -1,12 +1,18 @@
 """PDF Redactor - Main entry point."""
 
 import sys
+from PyQt6.QtGui import QSurfaceFormat
 from PyQt6.QtWidgets import QApplication
 from views.main_window import MainWindow
 
 
 def main():
     """Initialize and run the PDF Redactor application."""
+    # Sync OpenGL buffer swaps to the display refresh (must precede QApplication)
+    surface_format = QSurfaceFormat.defaultFormat()
+    surface_format.setSwapInterval(1)
+    QSurfaceFormat.setDefaultFormat(surface_format)
+
     app = QApplication(sys.argv)
 
     # Set application metadata
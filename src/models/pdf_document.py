@@ -1,19 +1,148 @@
 """PDF Document Model - Wrapper around PyMuPDF for PDF operations."""
 
+from array import array
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from functools import partial
+from itertools import chain
+import heapq
+import os
+import tempfile
 from typing import Optional
 import fitz  # PyMuPDF
+from PyQt6.QtCore import QMutex, QMutexLocker
 from PyQt6.QtGui import QImage
 
 
+Box = tuple[float, float, float, float]
+
+
+def _merge_spans(rects: list[Box], horizontal: bool) -> list[Box]:
+    """
+    Join rectangles that share a full edge span and overlap or touch.
+
+    Rectangles are bucketed by their exact (y0, y1) span when joining
+    horizontally, or (x0, x1) span when joining vertically, and each bucket is
+    swept in start order, so the union of every joined run is a rectangle.
+
+    Args:
+        rects: Rectangles as (x0, y0, x1, y1)
+        horizontal: Join along x if True, along y otherwise
+
+    Returns:
+        Rectangles covering the same area
+    """
+    # Work in (span, start, end) form: span is the shared edge, start/end the
+    # extent along the joining axis
+    buckets: dict[tuple[float, float], list[tuple[float, float]]] = defaultdict(list)
+    for x0, y0, x1, y1 in rects:
+        if horizontal:
+            buckets[(y0, y1)].append((x0, x1))
+        else:
+            buckets[(x0, x1)].append((y0, y1))
+
+    result: list[Box] = []
+    for (lo, hi), intervals in buckets.items():
+        intervals.sort()
+        start, end = intervals[0]
+        for next_start, next_end in intervals[1:]:
+            if next_start <= end:
+                end = max(end, next_end)
+            else:
+                result.append((start, lo, end, hi) if horizontal else (lo, start, hi, end))
+                start, end = next_start, next_end
+        result.append((start, lo, end, hi) if horizontal else (lo, start, hi, end))
+    return result
+
+
+def _drop_contained(rects: list[Box]) -> list[Box]:
+    """
+    Drop rectangles that lie inside another one.
+
+    Sweeps in x0 order (wider first on ties) and only compares against kept
+    rectangles whose x1 has not yet been passed, so disjoint boxes such as
+    OCR words never meet each other.
+
+    Args:
+        rects: Distinct rectangles as (x0, y0, x1, y1)
+
+    Returns:
+        The rectangles not contained in any other
+    """
+    kept: list[Box] = []
+    active: list[tuple[float, int]] = []  # Min-heap of (x1, index into kept)
+    for rect in sorted(rects, key=lambda r: (r[0], -r[2], r[1], -r[3])):
+        x0, y0, x1, y1 = rect
+        while active and active[0][0] < x0:
+            heapq.heappop(active)
+
+        if any(
+            kept[i][2] >= x1 and kept[i][1] <= y0 and kept[i][3] >= y1
+            for _, i in active
+        ):
+            continue
+
+        heapq.heappush(active, (x1, len(kept)))
+        kept.append(rect)
+    return kept
+
+
+def _merge_redaction_rects(coords: array) -> list[fitz.Rect]:
+    """
+    Merge redaction rectangles whose union covers exactly a rectangle.
+
+    Duplicated and nested rectangles, and strips that extend each other, are
+    collapsed so fewer redaction annotations need to be applied. Rectangles
+    are never merged into a bounding box that covers area the user did not
+    select, so the redacted region is unchanged.
+
+    Args:
+        coords: Flat x0, y0, x1, y1 sequence of redaction rectangles in PDF coordinates
+
+    Returns:
+        Merged rectangles covering the same area
+    """
+    merged = list(dict.fromkeys(tuple(coords[i:i + 4]) for i in range(0, len(coords), 4)))
+
+    # A join can expose a new containment or shared span; repeat until stable
+    while merged:
+        count = len(merged)
+        merged = _drop_contained(merged)
+        merged = _merge_spans(merged, horizontal=True)
+        merged = _merge_spans(merged, horizontal=False)
+        if len(merged) == count:
+            break
+
+    return [fitz.Rect(*rect) for rect in merged]
+
+
 class PDFDocument:
     """Manages PDF document operations including rendering and redaction."""
 
+    # Maximum pixel data (bytes) kept in the render cache
+    MAX_CACHE_BYTES = 64 * 1024 * 1024
+    # Maximum number of parsed pages kept in the display list cache
+    MAX_DISPLAYLISTS = 16
+
     def __init__(self):
         """Initialize an empty PDF document."""
         self.doc: Optional[fitz.Document] = None
         self.current_page_num: int = 0
-        self.redaction_rects: dict[int, list[fitz.Rect]] = {}  # {page_num: [rect1, rect2, ...]}
+        # {page_num: array('d', [x0, y0, x1, y1, x0, y0, ...])}; one flat buffer
+        # of doubles per page instead of a fitz.Rect object per redaction
+        self.redaction_rects: defaultdict[int, array] = self._new_redaction_store()
         self.file_path: Optional[str] = None
+        # LRU cache of rendered pages: {(page_num, zoom): (QImage, page_size, buffer)}
+        self._render_cache: OrderedDict[
+            tuple[int, float], tuple[QImage, tuple[float, float], bytes]
+        ] = OrderedDict()
+        # LRU of parsed page content, reused when a page is rendered at another zoom
+        self._displaylists: OrderedDict[int, fitz.DisplayList] = OrderedDict()
+        # Transformation matrix for the last zoom rendered: (zoom, matrix)
+        self._zoom_matrix: Optional[tuple[float, fitz.Matrix]] = None
+        # Serializes access to the document and cache; pages are rendered
+        # from worker threads and MuPDF documents are not thread-safe
+        self._lock = QMutex()
 
     def open_pdf(self, file_path: str) -> bool:
         """
@@ -27,10 +156,13 @@ class PDFDocument:
         """
         try:
             self.close_pdf()  # Close any existing document
-            self.doc = fitz.open(file_path)
-            self.file_path = file_path
-            self.current_page_num = 0
-            self.redaction_rects = {}
+            with QMutexLocker(self._lock):
+                self.doc = fitz.open(file_path)
+                self.file_path = file_path
+                self.current_page_num = 0
+                self.redaction_rects = self._new_redaction_store()
+                self._render_cache.clear()
+                self._displaylists.clear()
             return True
         except Exception as e:
             print(f"Error opening PDF: {e}")
@@ -38,12 +170,21 @@ class PDFDocument:
 
     def close_pdf(self) -> None:
         """Close the current PDF document."""
-        if self.doc:
-            self.doc.close()
-            self.doc = None
-            self.file_path = None
-            self.current_page_num = 0
-            self.redaction_rects = {}
+        with QMutexLocker(self._lock):
+            if self.doc:
+                self.doc.close()
+                self.doc = None
+                self.file_path = None
+                self.current_page_num = 0
+                self.redaction_rects = self._new_redaction_store()
+            self._render_cache.clear()
+            self._displaylists.clear()
+            self._zoom_matrix = None
+
+    @staticmethod
+    def _new_redaction_store() -> defaultdict[int, array]:
+        """Create an empty {page_num: coordinate array} redaction store."""
+        return defaultdict(partial(array, 'd'))
 
     def get_page_count(self) -> int:
         """
@@ -56,47 +197,92 @@ class PDFDocument:
             return len(self.doc)
         return 0
 
-    def render_page(self, page_num: int, zoom: float = 1.0) -> tuple[Optional[QImage], tuple[float, float]]:
+    def render_page(
+        self, page_num: int, zoom: float = 1.0, clip: Optional[fitz.Rect] = None
+    ) -> tuple[Optional[QImage], tuple[float, float]]:
         """
-        Render a PDF page to a QImage.
+        Render a PDF page, or a region of it, to a QImage.
+
+        Recently rendered pages are served from an LRU cache keyed by
+        (page_num, zoom), so revisiting a page does not rasterize it again.
+        The returned QImage shares its pixel buffer with the cache, so callers
+        must not modify it in place (convert it or call copy() first).
+        Clipped renders are not cached.
 
         Args:
             page_num: Page number (0-indexed)
             zoom: Zoom factor (1.0 = 100%, 2.0 = 200%, etc.)
+            clip: Region to render in PDF coordinates (points), or None for the whole page
 
         Returns:
             Tuple of (QImage, (page_width, page_height)) or (None, (0, 0)) if error
         """
+        with QMutexLocker(self._lock):
+            return self._render_page(page_num, zoom, clip)
+
+    def _render_page(
+        self, page_num: int, zoom: float, clip: Optional[fitz.Rect]
+    ) -> tuple[Optional[QImage], tuple[float, float]]:
+        """Render a page as described in render_page(); the caller must hold the lock."""
         if not self.doc or page_num < 0 or page_num >= len(self.doc):
             return None, (0.0, 0.0)
 
+        key = (page_num, zoom)
+        cached = self._render_cache.get(key) if clip is None else None
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            img, page_size, _ = cached
+            return img, page_size
+
         try:
-            page = self.doc.load_page(page_num)
+            # Parse the page content once; later zooms only re-run rasterization
+            dl = self._displaylists.get(page_num)
+            if dl is None:
+                dl = self.doc.load_page(page_num).get_displaylist()
+                self._displaylists[page_num] = dl
+                if len(self._displaylists) > self.MAX_DISPLAYLISTS:
+                    self._displaylists.popitem(last=False)
+            else:
+                self._displaylists.move_to_end(page_num)
 
             # Get original page dimensions (in PDF points)
-            page_rect = page.rect
+            page_rect = dl.rect
             page_width = page_rect.width
             page_height = page_rect.height
 
-            # Create transformation matrix for zoom
-            mat = fitz.Matrix(zoom, zoom)
+            # Reuse the transformation matrix while the zoom stays the same
+            if self._zoom_matrix is None or self._zoom_matrix[0] != zoom:
+                self._zoom_matrix = (zoom, fitz.Matrix(zoom, zoom))
+            mat = self._zoom_matrix[1]
 
             # Render page to pixmap
-            pix = page.get_pixmap(matrix=mat)
+            pix = dl.get_pixmap(matrix=mat, alpha=False, clip=clip)
+
+            # Immutable copy of the pixel data; the QImage wraps it without copying
+            buf = bytes(pix.samples)
 
             # Convert PyMuPDF pixmap to QImage
             img = QImage(
-                pix.samples,
+                buf,
                 pix.width,
                 pix.height,
                 pix.stride,
                 QImage.Format.Format_RGB888
             )
+            # Tie the buffer's lifetime to the image so it survives cache eviction
+            img._buf = buf
 
-            # Make a copy to ensure the data persists
-            img = img.copy()
+            page_size = (page_width, page_height)
+            if clip is None:
+                self._render_cache[key] = (img, page_size, buf)
+                # Evict by size rather than count: a page at 4x zoom is 16x
+                # the bytes of the same page at 1x. The newest entry always stays.
+                total = sum(len(entry[2]) for entry in self._render_cache.values())
+                while total > self.MAX_CACHE_BYTES and len(self._render_cache) > 1:
+                    _, (_, _, old_buf) = self._render_cache.popitem(last=False)
+                    total -= len(old_buf)
 
-            return img, (page_width, page_height)
+            return img, page_size
         except Exception as e:
             print(f"Error rendering page {page_num}: {e}")
             return None, (0.0, 0.0)
@@ -109,16 +295,63 @@ class PDFDocument:
             page_num: Page number (0-indexed)
             rect: Rectangle to redact in PDF coordinates
         """
-        if page_num not in self.redaction_rects:
-            self.redaction_rects[page_num] = []
-        self.redaction_rects[page_num].append(rect)
+        # Redactions are drawn as overlays until saved, so cached renders of
+        # the page stay valid; they are dropped once redactions are applied
+        with QMutexLocker(self._lock):
+            self.redaction_rects[page_num].extend((rect.x0, rect.y0, rect.x1, rect.y1))
+
+    def add_redaction_boxes(self, page_num: int, boxes: Iterable[Box]) -> None:
+        """
+        Add many redaction rectangles for a page in one call.
+
+        Args:
+            page_num: Page number (0-indexed)
+            boxes: Rectangles as (x0, y0, x1, y1) in PDF coordinates
+        """
+        coords = array('d', chain.from_iterable(boxes))
+        with QMutexLocker(self._lock):
+            self.redaction_rects[page_num].extend(coords)
+
+    def get_redaction_rects(self, page_num: int) -> list[Box]:
+        """
+        Get the redaction rectangles stored for a page.
+
+        Args:
+            page_num: Page number (0-indexed)
+
+        Returns:
+            Rectangles as (x0, y0, x1, y1) in PDF coordinates
+        """
+        with QMutexLocker(self._lock):
+            coords = self.redaction_rects.get(page_num)
+            if coords is None:
+                return []
+            return [tuple(coords[i:i + 4]) for i in range(0, len(coords), 4)]
 
-    def save_redacted_pdf(self, output_path: str) -> bool:
+    def _invalidate_page(self, page_num: int) -> None:
+        """
+        Drop all cached renders of a page. The caller must hold the lock.
+
+        Args:
+            page_num: Page number (0-indexed)
+        """
+        for key in [key for key in self._render_cache if key[0] == page_num]:
+            del self._render_cache[key]
+
+    def save_redacted_pdf(self, output_path: str, full_rewrite: bool = False) -> bool:
         """
         Save the PDF with redactions applied.
 
+        The file is always fully rewritten, never saved incrementally: an
+        incremental save would keep the redacted content in earlier revisions
+        of the file. By default only unused objects are dropped (garbage=1),
+        which already removes the content replaced by the redactions. Saving
+        over the open file writes a temporary file next to it and replaces the
+        original, then reopens the document from the saved file.
+
         Args:
             output_path: Path where to save the redacted PDF
+            full_rewrite: Also deduplicate and compact objects (garbage=4); slower
 
         Returns:
             True if successful, False otherwise
@@ -126,28 +359,93 @@ class PDFDocument:
         if not self.doc:
             return False
 
-        try:
-            # Apply redactions to each page
-            for page_num, rects in self.redaction_rects.items():
-                if page_num < 0 or page_num >= len(self.doc):
-                    continue
+        with QMutexLocker(self._lock):
+            # Decide before touching the document, so a failing check cannot
+            # leave redactions applied in memory but unsaved
+            overwrite_source = self._is_source_file(output_path)
 
-                page = self.doc.load_page(page_num)
+            try:
+                # Apply redactions to each page
+                for page_num, coords in self.redaction_rects.items():
+                    if page_num < 0 or page_num >= len(self.doc):
+                        continue
 
-                # Add redaction annotations (black rectangles)
-                for rect in rects:
-                    page.add_redact_annot(rect, fill=(0, 0, 0))
+                    page = self.doc.load_page(page_num)
 
-                # Apply redactions (this permanently removes content)
-                page.apply_redactions()
+                    # Add redaction annotations (black rectangles), merging
+                    # overlapping ones so fewer annotations are applied
+                    for rect in _merge_redaction_rects(coords):
+                        page.add_redact_annot(rect, fill=(0, 0, 0))
 
-            # Save to output file
-            self.doc.save(output_path, garbage=4, deflate=True)
-            return True
-        except Exception as e:
-            print(f"Error saving redacted PDF: {e}")
+                    # Apply redactions (this permanently removes content)
+                    page.apply_redactions()
+                    self._invalidate_page(page_num)
+                    self._displaylists.pop(page_num, None)
+
+                # Save to output file
+                if full_rewrite:
+                    save_options = {"garbage": 4, "deflate": True}
+                else:
+                    save_options = {"garbage": 1, "deflate": True, "clean": False}
+
+                if overwrite_source:
+                    self._save_over_source(output_path, save_options)
+                else:
+                    self.doc.save(output_path, **save_options)
+                return True
+            except Exception as e:
+                print(f"Error saving redacted PDF: {e}")
+                return False
+
+    def _is_source_file(self, path: str) -> bool:
+        """
+        Check whether a path refers to the file the document was opened from.
+
+        Args:
+            path: Path to compare
+
+        Returns:
+            True if both paths exist and are the same file; False otherwise,
+            including when the source was moved or deleted after opening
+        """
+        if not self.file_path:
+            return False
+        try:
+            return os.path.samefile(path, self.file_path)
+        except OSError:
             return False
 
+    def _save_over_source(self, output_path: str, save_options: dict) -> None:
+        """
+        Replace the file the document was opened from with its current content.
+
+        MuPDF refuses non-incremental saves to the open file, so the document
+        is written to a temporary file in the same directory, closed, moved
+        over the original and reopened. The caller must hold the lock.
+
+        Args:
+            output_path: Path of the open document's file
+            save_options: Keyword arguments for fitz.Document.save()
+        """
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".pdf", dir=os.path.dirname(os.path.abspath(output_path))
+        )
+        os.close(fd)
+        try:
+            self.doc.save(temp_path, **save_options)
+
+            # Release the source file before replacing it (required on Windows)
+            self.doc.close()
+            try:
+                os.replace(temp_path, output_path)
+            finally:
+                self.doc = fitz.open(output_path)
+                self._render_cache.clear()
+                self._displaylists.clear()
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
     def is_open(self) -> bool:
         """Check if a PDF document is currently open."""
         return self.doc is not None
@@ -3,8 +3,8 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QFileDialog, QToolBar, QStatusBar, QMessageBox, QLabel, QWidget, QSpinBox
 )
-from PyQt6.QtCore import QRectF, Qt
-from PyQt6.QtGui import QAction, QKeySequence
+from PyQt6.QtCore import QRectF, Qt, QTimer
+from PyQt6.QtGui import QAction, QImage, QKeySequence
 
 from views.pdf_viewer import PDFViewer
 from controllers.redaction_controller import RedactionController
@@ -13,6 +13,9 @@ from controllers.redaction_controller import RedactionController
 class MainWindow(QMainWindow):
     """Main application window with menu, toolbar, and PDF viewer."""
 
+    # Idle time after a page is shown before the next page is prefetched
+    PREFETCH_DELAY_MS = 1500
+
     def __init__(self):
         super().__init__()
 
@@ -20,6 +23,12 @@ class MainWindow(QMainWindow):
         self.pdf_viewer = PDFViewer()
         self.controller = RedactionController()
 
+        # Prefetching stalls Python event handling while it renders, so it
+        # only runs after the user has left the current page alone for a while
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self.prefetch_when_idle)
+
         # Setup UI
         self.setup_ui()
         self.create_menu_bar()
@@ -60,6 +69,12 @@ class MainWindow(QMainWindow):
         self.save_action.triggered.connect(self.save_pdf_dialog)
         file_menu.addAction(self.save_action)
 
+        # Full rewrite option (slower, smaller files)
+        self.full_rewrite_action = QAction("&Full Rewrite on Save (slower)", self)
+        self.full_rewrite_action.setCheckable(True)
+        self.full_rewrite_action.setStatusTip("Deduplicate and compact the whole file when saving")
+        file_menu.addAction(self.full_rewrite_action)
+
         file_menu.addSeparator()
 
         # Exit action
@@ -132,6 +147,15 @@ class MainWindow(QMainWindow):
         self.pdf_viewer.next_page_requested.connect(self.next_page)
         self.pdf_viewer.previous_page_requested.connect(self.previous_page)
 
+        # Display pages rendered in the background
+        self.controller.page_rendered.connect(self.on_page_rendered)
+        self.controller.zoom_rendered.connect(self.on_zoom_rendered)
+
+        # Re-render at the new resolution once zooming settles
+        self.pdf_viewer.rerender_requested.connect(self.on_rerender_requested)
+        self.controller.tile_rendered.connect(self.on_tile_rendered)
+        self.controller.set_visible_rect_provider(self.pdf_viewer.get_visible_pdf_rect)
+
     def open_pdf_dialog(self) -> None:
         """Open file dialog to select a PDF file."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -151,21 +175,32 @@ class MainWindow(QMainWindow):
         Args:
             file_path: Path to the PDF file
         """
+        # A zoom re-render scheduled for the old document must not fire
+        self.pdf_viewer.cancel_pending_rerender()
+
         success, message = self.controller.open_pdf(file_path)
 
         if success:
             self.current_file_path = file_path
 
+            # Pixmaps of the previous document must not be reused
+            self.pdf_viewer.clear_pixmap_cache()
+
             # Get rendered page from controller
             qimage, page_size = self.controller.get_current_page_image()
 
             if qimage:
                 # Display in viewer
-                self.pdf_viewer.set_page_image(qimage, page_size)
+                self.pdf_viewer.set_page_image(
+                    qimage, page_size, self.current_render_key(), reset_zoom=True
+                )
 
                 # Update UI state
                 self.update_window_state()
                 self.status_bar.showMessage(f"Loaded: {file_path}")
+
+                # Warm the render cache with the next page once idle
+                self._prefetch_timer.start(self.PREFETCH_DELAY_MS)
             else:
                 self.show_error("Failed to render PDF page")
         else:
@@ -205,7 +240,12 @@ class MainWindow(QMainWindow):
         Args:
             output_path: Path where to save the file
         """
-        success = self.controller.save_redacted_pdf(output_path)
+        success = self.controller.save_redacted_pdf(
+            output_path, self.full_rewrite_action.isChecked()
+        )
+
+        # Applying redactions changed the document, so cached pixmaps are stale
+        self.pdf_viewer.clear_pixmap_cache()
 
         if success:
             self.status_bar.showMessage(f"Saved: {output_path}")
@@ -252,25 +292,108 @@ class MainWindow(QMainWindow):
             total = self.controller.get_page_count()
             self.page_label.setText(f"Page {current} of {total}")
 
+    def current_render_key(self) -> tuple[int, float]:
+        """Get the (page_num, zoom) key identifying the controller's current rendering."""
+        return self.controller.get_current_page_number(), self.controller.current_zoom
+
+    def prefetch_when_idle(self) -> None:
+        """Prefetch the next page unless the user is in the middle of drawing."""
+        if self.pdf_viewer.is_drawing:
+            self._prefetch_timer.start(self.PREFETCH_DELAY_MS)
+            return
+        self.controller.prefetch_next_page()
+
     def previous_page(self) -> None:
         """Navigate to the previous page."""
-        qimage, page_size = self.controller.previous_page()
-        if qimage:
-            self.pdf_viewer.set_page_image(qimage, page_size)
-            self.pdf_viewer.scroll_to_top()  # Reset scroll to top of page
-            self.update_window_state()
-            current = self.controller.get_current_page_number() + 1
-            self.status_bar.showMessage(f"Page {current}")
+        # Ignore repeated scroll requests until the requested page is shown
+        if self.controller.is_render_pending() or not self.controller.has_previous_page():
+            return
+        self.controller.request_page(self.controller.get_current_page_number() - 1)
 
     def next_page(self) -> None:
         """Navigate to the next page."""
-        qimage, page_size = self.controller.next_page()
-        if qimage:
-            self.pdf_viewer.set_page_image(qimage, page_size)
-            self.pdf_viewer.scroll_to_top()  # Reset scroll to top of page
-            self.update_window_state()
-            current = self.controller.get_current_page_number() + 1
-            self.status_bar.showMessage(f"Page {current}")
+        # Ignore repeated scroll requests until the requested page is shown
+        if self.controller.is_render_pending() or not self.controller.has_next_page():
+            return
+        self.controller.request_page(self.controller.get_current_page_number() + 1)
+
+    def on_page_rendered(self, qimage: QImage, page_size: tuple) -> None:
+        """
+        Display a page that finished rendering in the background.
+
+        Args:
+            qimage: Rendered page image
+            page_size: Original PDF page size
+        """
+        # Keep the user's zoom while navigating
+        self.pdf_viewer.set_page_image(
+            qimage, page_size, self.current_render_key(), reset_zoom=False
+        )
+        self.pdf_viewer.scroll_to_top()  # Reset scroll to top of page
+
+        # Redraw the redactions already made on this page
+        self.pdf_viewer.add_redactions_bulk(self.controller.get_current_page_redactions())
+
+        self.update_window_state()
+        current = self.controller.get_current_page_number() + 1
+        self.status_bar.showMessage(f"Page {current}")
+
+        # The kept zoom may call for a sharper rendering of the new page
+        self.on_rerender_requested(self.pdf_viewer.zoom_factor)
+
+        # Warm the render cache with the next page once idle
+        self._prefetch_timer.start(self.PREFETCH_DELAY_MS)
+
+    def on_rerender_requested(self, zoom_factor: float) -> None:
+        """
+        Re-render the current page to match the viewer's zoom.
+
+        Args:
+            zoom_factor: Viewer scale relative to the displayed image
+        """
+        # The user is interacting; postpone any prefetch
+        self._prefetch_timer.stop()
+
+        if abs(zoom_factor - 1.0) < 1e-3 or self.controller.is_render_pending():
+            return
+
+        zoom = self.controller.current_zoom * zoom_factor
+        max_zoom = self.controller.MAX_RENDER_ZOOM
+        if zoom > max_zoom and self.controller.current_zoom >= max_zoom:
+            # Already at the highest full-page resolution; sharpen only what is visible
+            self.controller.request_visible_tile(zoom)
+        else:
+            self.controller.request_zoom(zoom)
+
+    def on_zoom_rendered(
+        self, qimage: QImage, page_size: tuple, old_zoom: float, new_zoom: float
+    ) -> None:
+        """
+        Swap in a page re-rendered at the new zoom.
+
+        Args:
+            qimage: Rendered page image
+            page_size: Original PDF page size
+            old_zoom: Zoom the previously displayed image was rendered at
+            new_zoom: Zoom the new image was rendered at
+        """
+        self.pdf_viewer.set_page_resolution(
+            qimage, page_size, new_zoom / old_zoom, self.current_render_key()
+        )
+
+        # Catch up with zooming that happened while this render was in flight
+        self.on_rerender_requested(self.pdf_viewer.zoom_factor)
+
+    def on_tile_rendered(self, qimage: QImage, clip: tuple, zoom: float) -> None:
+        """
+        Overlay a sharper rendering of the visible region.
+
+        Args:
+            qimage: Rendered region of the page
+            clip: Rendered region in PDF coordinates
+            zoom: Zoom factor the region was rendered at
+        """
+        self.pdf_viewer.set_page_tile(qimage, clip, zoom, self.controller.current_zoom)
 
     def show_error(self, message: str) -> None:
         """
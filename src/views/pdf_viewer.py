@@ -1,8 +1,51 @@
 """PDF Viewer widget with redaction drawing capabilities."""
 
-from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsPixmapItem
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsRectItem, QGraphicsPixmapItem, QGraphicsItemGroup
+)
 from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRectF, QTimer
-from PyQt6.QtGui import QPixmap, QImage, QPen, QBrush, QColor, QCursor, QMouseEvent, QPainter, QWheelEvent
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+from PyQt6.QtGui import (
+    QPixmap, QImage, QPen, QBrush, QColor, QCursor, QMouseEvent, QPainter, QWheelEvent,
+    QOpenGLContext, QOffscreenSurface
+)
+
+# Shared pens and brushes; items copy them by value, so one instance serves all
+_REDACT_PEN = QPen(Qt.GlobalColor.black, 2)
+_REDACT_BRUSH = QBrush(Qt.GlobalColor.black)
+_DRAW_PEN = QPen(Qt.GlobalColor.red, 2, Qt.PenStyle.DashLine)
+_DRAW_BRUSH = QBrush(QColor(255, 0, 0, 50))  # Semi-transparent red
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    """Approximate memory held by a pixmap's pixel data."""
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def _opengl_available() -> bool:
+    """
+    Check whether an OpenGL context can be created and made current.
+
+    Platforms without GL (e.g. the offscreen platform, some VMs and remote
+    sessions) cannot paint through a QOpenGLWidget at all.
+
+    Returns:
+        True if an OpenGL viewport can be used
+    """
+    context = QOpenGLContext()
+    if not context.create():
+        return False
+
+    surface = QOffscreenSurface()
+    surface.setFormat(context.format())
+    surface.create()
+    if not surface.isValid() or not context.makeCurrent(surface):
+        return False
+
+    context.doneCurrent()
+    return True
 
 
 class PDFViewerScene(QGraphicsScene):
@@ -17,9 +60,10 @@ class RedactionRectItem(QGraphicsRectItem):
 
     def __init__(self, rect: QRectF):
         super().__init__(rect)
+        self.setZValue(1.0)  # Above the page image and detail tile
         # Solid black rectangle
-        self.setPen(QPen(Qt.GlobalColor.black, 2))
-        self.setBrush(QBrush(Qt.GlobalColor.black))
+        self.setPen(_REDACT_PEN)
+        self.setBrush(_REDACT_BRUSH)
 
 
 class PDFViewer(QGraphicsView):
@@ -31,11 +75,18 @@ class PDFViewer(QGraphicsView):
                         Parameters: (QRectF rect, tuple page_size)
         next_page_requested: Emitted when user scrolls past the bottom
         previous_page_requested: Emitted when user scrolls past the top
+        rerender_requested: Emitted once zooming settles, to request the page
+                            at a resolution matching the view
+                            Parameters: (float zoom_factor relative to the current image)
     """
 
+    # Maximum pixel data (bytes) kept in the pixmap cache
+    MAX_PIXMAP_CACHE_BYTES = 64 * 1024 * 1024
+
     redaction_added = pyqtSignal(QRectF, tuple)  # rect, page_size
     next_page_requested = pyqtSignal()
     previous_page_requested = pyqtSignal()
+    rerender_requested = pyqtSignal(float)  # zoom_factor
 
     def __init__(self):
         super().__init__()
@@ -44,18 +95,41 @@ class PDFViewer(QGraphicsView):
         self.scene = PDFViewerScene()
         self.setScene(self.scene)
 
+        # Composite the page and overlays on the GPU when OpenGL works here;
+        # otherwise keep the default raster viewport
+        self.uses_opengl = _opengl_available()
+        if self.uses_opengl:
+            self.setViewport(QOpenGLWidget(self))
+
         # PDF display
         self.pixmap_item: QGraphicsPixmapItem | None = None
+        self.tile_item: QGraphicsPixmapItem | None = None  # High-zoom detail of the visible region
         self.page_size: tuple[float, float] = (0.0, 0.0)  # Original PDF page size
 
+        # LRU of already converted page pixmaps, one zoom per page:
+        # {page_num: (zoom, QPixmap)}
+        self._pixmap_cache: OrderedDict[int, tuple[float, QPixmap]] = OrderedDict()
+
         # Drawing state
         self.drawing_rect: QGraphicsRectItem | None = None
         self.start_point: QPointF | None = None
         self.is_drawing: bool = False
 
+        # Coalesce drag updates to one per display frame
+        self._pending_point: QPointF | None = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self._apply_pending_move)
+
         # Zoom
         self.zoom_factor: float = 1.0
 
+        # Zoom is applied instantly as a view transform; a sharp re-render is
+        # requested only after zooming has been idle for a moment
+        self._rerender_timer = QTimer(self)
+        self._rerender_timer.setSingleShot(True)
+        self._rerender_timer.timeout.connect(lambda: self.rerender_requested.emit(self.zoom_factor))
+
         # View settings - enable high quality rendering
         self.setRenderHints(
             QPainter.RenderHint.Antialiasing |
@@ -63,6 +137,17 @@ class PDFViewer(QGraphicsView):
             QPainter.RenderHint.TextAntialiasing
         )
         self.setDragMode(QGraphicsView.DragMode.NoDrag)
+
+        # A page holds one large pixmap and a few rectangles, so a spatial
+        # index costs more than it saves. An OpenGL viewport redraws whole
+        # frames anyway, so dirty-region tracking is skipped there too
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        if self.uses_opengl:
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setCursor(QCursor(Qt.CursorShape.CrossCursor))
 
         # Enable scrollbars for large documents
@@ -72,19 +157,72 @@ class PDFViewer(QGraphicsView):
         # Enable mouse tracking
         self.setMouseTracking(True)
 
-    def set_page_image(self, qimage: QImage, page_size: tuple[float, float]) -> None:
+        # Panning while magnified past the rendered resolution needs a new tile
+        self.horizontalScrollBar().valueChanged.connect(self._on_view_scrolled)
+        self.verticalScrollBar().valueChanged.connect(self._on_view_scrolled)
+
+    def _get_pixmap(self, qimage: QImage, cache_key: tuple[int, float] | None) -> QPixmap:
+        """
+        Convert a page image to a QPixmap, reusing a cached conversion if possible.
+
+        Args:
+            qimage: Rendered PDF page as QImage
+            cache_key: (page_num, zoom) the image was rendered for, or None to skip caching
+
+        Returns:
+            Pixmap of the page
+        """
+        if cache_key is None:
+            return QPixmap.fromImage(qimage)
+
+        page_num, zoom = cache_key
+        cached = self._pixmap_cache.get(page_num)
+        if cached is not None and cached[0] == zoom:
+            self._pixmap_cache.move_to_end(page_num)
+            return cached[1]
+
+        # A new zoom for the page replaces its older pixmap
+        pixmap = QPixmap.fromImage(qimage)
+        self._pixmap_cache[page_num] = (zoom, pixmap)
+        self._pixmap_cache.move_to_end(page_num)
+
+        total = sum(_pixmap_bytes(p) for _, p in self._pixmap_cache.values())
+        while total > self.MAX_PIXMAP_CACHE_BYTES and len(self._pixmap_cache) > 1:
+            _, (_, old) = self._pixmap_cache.popitem(last=False)
+            total -= _pixmap_bytes(old)
+        return pixmap
+
+    def cancel_pending_rerender(self) -> None:
+        """Stop a scheduled zoom re-render, e.g. when a new document replaces the page."""
+        self._rerender_timer.stop()
+
+    def clear_pixmap_cache(self) -> None:
+        """Forget cached page pixmaps, e.g. after the document content changed."""
+        self._pixmap_cache.clear()
+
+    def set_page_image(
+        self,
+        qimage: QImage,
+        page_size: tuple[float, float],
+        cache_key: tuple[int, float] | None = None,
+        reset_zoom: bool = False,
+    ) -> None:
         """
         Display a PDF page image in the viewer.
 
         Args:
             qimage: Rendered PDF page as QImage
             page_size: Original PDF page dimensions (width, height) in points
+            cache_key: (page_num, zoom) the image was rendered for; when given,
+                       the converted pixmap is cached and reused on revisits
+            reset_zoom: Show the image at native resolution instead of keeping
+                        the current view zoom (e.g. for a newly opened document)
         """
         # Clear existing content
         self.clear_page()
 
         # Convert QImage to QPixmap and add to scene
-        pixmap = QPixmap.fromImage(qimage)
+        pixmap = self._get_pixmap(qimage, cache_key)
         self.pixmap_item = self.scene.addPixmap(pixmap)
 
         # Store page size for coordinate conversion
@@ -94,13 +232,152 @@ class PDFViewer(QGraphicsView):
         self.setSceneRect(self.pixmap_item.boundingRect())
 
         # Reset transform to show image at native resolution (no scaling)
-        self.resetTransform()
-        self.zoom_factor = 1.0
+        if reset_zoom:
+            self.resetTransform()
+            self.zoom_factor = 1.0
+
+    def set_page_resolution(
+        self,
+        qimage: QImage,
+        page_size: tuple[float, float],
+        ratio: float,
+        cache_key: tuple[int, float] | None = None,
+    ) -> None:
+        """
+        Replace the current page image with a rendering at another resolution.
+
+        Redaction overlays and any rectangle being drawn are rescaled with the
+        image, and the view transform is compensated so the page keeps its
+        on-screen size and position.
+
+        Args:
+            qimage: Page re-rendered at the new zoom
+            page_size: Original PDF page dimensions (width, height) in points
+            ratio: New render zoom divided by the previous one. Taken from the
+                   zooms rather than the pixmap widths, which are rounded to
+                   whole pixels
+            cache_key: (page_num, zoom) the image was rendered for, see set_page_image()
+        """
+        if not self.pixmap_item:
+            self.set_page_image(qimage, page_size, cache_key)
+            return
+
+        center = self.mapToScene(self.viewport().rect().center())
+
+        # The detail tile is positioned for the old resolution
+        self._remove_tile()
+
+        self.pixmap_item.setPixmap(self._get_pixmap(qimage, cache_key))
+        self.page_size = page_size
+        self.setSceneRect(self.pixmap_item.boundingRect())
+
+        # Rescale overlays into the new image's pixel coordinates
+        for item in self.scene.items():
+            if isinstance(item, QGraphicsRectItem):
+                rect = item.rect()
+                item.setRect(QRectF(rect.topLeft() * ratio, rect.bottomRight() * ratio))
+        if self.start_point:
+            self.start_point *= ratio
+        if self._pending_point:
+            self._pending_point *= ratio
+
+        # Keep the visual size unchanged
+        self.scale(1 / ratio, 1 / ratio)
+        self.zoom_factor /= ratio
+        self.centerOn(center * ratio)
+
+    def get_visible_pdf_rect(self, zoom: float) -> tuple[float, float, float, float] | None:
+        """
+        Get the part of the page currently on screen.
+
+        Args:
+            zoom: Zoom factor the page image was rendered at
+
+        Returns:
+            Visible region (x0, y0, x1, y1) in PDF coordinates, or None if no
+            page is shown
+        """
+        if not self.pixmap_item:
+            return None
+
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        visible = visible.intersected(self.pixmap_item.boundingRect())
+        if visible.isEmpty():
+            return None
+
+        inv_zoom = 1.0 / zoom
+        return (
+            visible.left() * inv_zoom,
+            visible.top() * inv_zoom,
+            visible.right() * inv_zoom,
+            visible.bottom() * inv_zoom,
+        )
+
+    def set_page_tile(
+        self, qimage: QImage, clip: tuple[float, float, float, float], tile_zoom: float, page_zoom: float
+    ) -> None:
+        """
+        Overlay a sharper rendering of part of the page.
+
+        The tile is scaled down into the page image's pixel coordinates, so
+        redaction coordinates are unaffected.
+
+        Args:
+            qimage: Rendered region of the page
+            clip: Rendered region (x0, y0, x1, y1) in PDF coordinates
+            tile_zoom: Zoom factor the tile was rendered at
+            page_zoom: Zoom factor the page image was rendered at
+        """
+        if not self.pixmap_item:
+            return
+
+        self._remove_tile()
+        self.tile_item = self.scene.addPixmap(QPixmap.fromImage(qimage))
+        self.tile_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self.tile_item.setZValue(0.5)  # Between the page image and the redactions
+        self.tile_item.setScale(page_zoom / tile_zoom)
+        self.tile_item.setPos(clip[0] * page_zoom, clip[1] * page_zoom)
+
+    def _remove_tile(self) -> None:
+        """Remove the detail tile, if any."""
+        if self.tile_item:
+            self.scene.removeItem(self.tile_item)
+            self.tile_item = None
+
+    def _on_view_scrolled(self) -> None:
+        """Request a new detail tile once panning settles while magnified."""
+        if self.pixmap_item and self.zoom_factor > 1.0:
+            self._rerender_timer.start(250)
+
+    def add_redactions_bulk(self, rects: list[QRectF]) -> None:
+        """
+        Display many stored redaction rectangles at once.
+
+        The rectangles are added to the scene as a single item group, so the
+        scene gets one addItem() instead of one per rectangle.
+        redaction_added is not emitted; the rectangles are already stored.
+
+        Args:
+            rects: Rectangles in scene coordinates (pixels of rendered image)
+        """
+        if not self.pixmap_item or not rects:
+            return
+
+        group = QGraphicsItemGroup()
+        group.setZValue(1.0)  # Same layer as individually drawn redactions
+        for rect in rects:
+            group.addToGroup(RedactionRectItem(rect))
+
+        self.scene.addItem(group)
 
     def clear_page(self) -> None:
         """Clear all items from the scene."""
+        self._move_timer.stop()
+        self._rerender_timer.stop()
+        self._pending_point = None
         self.scene.clear()
         self.pixmap_item = None
+        self.tile_item = None
         self.drawing_rect = None
         self.start_point = None
         self.is_drawing = False
@@ -113,27 +390,39 @@ class PDFViewer(QGraphicsView):
             self.start_point = self.mapToScene(event.pos())
             self.is_drawing = True
 
+            # Create the temporary rectangle (red with dashed border) once;
+            # mouse moves only resize it
+            self.drawing_rect = QGraphicsRectItem(QRectF(self.start_point, self.start_point))
+            self.drawing_rect.setZValue(2.0)  # Above everything else while drawing
+            self.drawing_rect.setPen(_DRAW_PEN)
+            self.drawing_rect.setBrush(_DRAW_BRUSH)
+            self.scene.addItem(self.drawing_rect)
+
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Handle mouse move to update the temporary redaction rectangle."""
-        if self.is_drawing and self.start_point:
-            # Get current point in scene coordinates
-            current_point = self.mapToScene(event.pos())
+        if self.is_drawing and self.start_point and self.drawing_rect:
+            # Remember the latest point; the rectangle is resized once per frame
+            self._pending_point = self.mapToScene(event.pos())
+            if not self._move_timer.isActive():
+                self._move_timer.start(self._frame_interval_ms())
 
-            # Remove previous temporary rectangle
-            if self.drawing_rect:
-                self.scene.removeItem(self.drawing_rect)
-                self.drawing_rect = None
+        super().mouseMoveEvent(event)
 
-            # Create new temporary rectangle (red with dashed border)
-            rect = QRectF(self.start_point, current_point).normalized()
-            self.drawing_rect = QGraphicsRectItem(rect)
-            self.drawing_rect.setPen(QPen(Qt.GlobalColor.red, 2, Qt.PenStyle.DashLine))
-            self.drawing_rect.setBrush(QBrush(QColor(255, 0, 0, 50)))  # Semi-transparent red
-            self.scene.addItem(self.drawing_rect)
+    def _frame_interval_ms(self) -> int:
+        """Get the display refresh interval in milliseconds."""
+        screen = self.screen()
+        refresh_rate = screen.refreshRate() if screen else 0.0
+        if refresh_rate <= 0:
+            refresh_rate = 60.0
+        return max(1, int(1000 / refresh_rate))
 
-        super().mouseMoveEvent(event)
+    def _apply_pending_move(self) -> None:
+        """Resize the temporary rectangle to the latest mouse position."""
+        if self.drawing_rect and self.start_point and self._pending_point:
+            self.drawing_rect.setRect(QRectF(self.start_point, self._pending_point).normalized())
+        self._pending_point = None
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Handle mouse release to finalize the redaction rectangle."""
@@ -141,7 +430,9 @@ class PDFViewer(QGraphicsView):
             # Get end point in scene coordinates
             end_point = self.mapToScene(event.pos())
 
-            # Remove temporary rectangle
+            # Drop any queued drag update, then remove temporary rectangle
+            self._move_timer.stop()
+            self._pending_point = None
             if self.drawing_rect:
                 self.scene.removeItem(self.drawing_rect)
                 self.drawing_rect = None
@@ -190,11 +481,13 @@ class PDFViewer(QGraphicsView):
         """Zoom in the view."""
         self.zoom_factor *= 1.25
         self.scale(1.25, 1.25)
+        self._rerender_timer.start(250)
 
     def zoom_out(self) -> None:
         """Zoom out the view."""
         self.zoom_factor /= 1.25
         self.scale(0.8, 0.8)
+        self._rerender_timer.start(250)
 
     def reset_zoom(self) -> None:
         """Reset zoom to fit the page."""
@@ -202,6 +495,8 @@ class PDFViewer(QGraphicsView):
             self.resetTransform()
             self.zoom_factor = 1.0
             self.fitInView(self.pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
+            self.zoom_factor = self.transform().m11()
+            self._rerender_timer.start(250)
 
     def scroll_to_top(self) -> None:
         """Scroll to the top of the page."""